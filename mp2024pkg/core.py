@@ -1,63 +1,138 @@
 import os 
+import sys
 import inspect
+import reprlib
+import itertools
 import types
 import pandas as pd 
 import IPython.display
 #--#
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Sequence
+
+# Builtin containers, checked concretely so the common cases skip collections.abc dispatch
+_CONTAINERS = (list, tuple, set, frozenset, dict)
+
+# Bounded repr for container values: formatting stops once the budget is spent,
+# so a huge list or dict is never rendered in full just to be cut short.
+# Only exact _CONTAINERS types benefit; reprlib formats subclasses (defaultdict,
+# namedtuple, ...) through a full repr(), so callers gate on type(value) in _CONTAINERS
+_short_repr = reprlib.Repr()
+_short_repr.maxlist = _short_repr.maxtuple = _short_repr.maxdict = 10
+_short_repr.maxset = _short_repr.maxfrozenset = 10
+_short_repr.maxstring = 100
+_short_repr.maxother = 100
+
+# Types that never have a length, checked by identity before falling back to len()
+_SCALARS = (int, float, bool, type(None))
+
+def _len_or_none(obj):
+    """Returns len(obj), or None for scalars and other objects without a length."""
+    if type(obj) in _SCALARS:
+        return None
+    try:
+        return len(obj)
+    except TypeError:
+        return None
+
+def _head_tail(items, items_len, max_head, max_tail):
+    """
+    Returns (index, item) pairs for the head and tail of items, with None in place of the skipped middle.
+    Sequences are indexed for the tail directly; other iterables are streamed through a ring buffer.
+    """
+    it = iter(items)
+    head = list(enumerate(itertools.islice(it, max_head)))
+
+    if items_len is not None and items_len <= max_head + max_tail:
+        return head + list(enumerate(it, start=len(head)))
+
+    if items_len is not None and isinstance(items, Sequence):
+        tail = [(i, items[i]) for i in range(items_len - max_tail, items_len)]
+    else:
+        # zip() draws from the counter before it, so the counter also records how many
+        # items were consumed past the head (plus one for the final, exhausted pull)
+        counter = itertools.count(len(head))
+        tail = list(deque(zip(counter, it), maxlen=max_tail))
+        n_rest = next(counter) - 1 - len(head)
+        if n_rest <= len(tail):
+            return head + tail  # Nothing was skipped
+
+    return head + [None] + tail
+
+def _keys_preview(dct, max_keys=20):
+    """Returns the first max_keys keys of a dictionary (or keys view) as a list repr, without copying every key."""
+    preview = list(itertools.islice(iter(dct), max_keys))
+    suffix = " ..." if len(dct) > max_keys else ""
+    return f"{preview}{suffix}"
+
+def _scan_dir(path, max_files):
+    """Returns the entries of a directory sorted by name, with None in place of those truncated beyond max_files."""
+    # scandir entries cache the file type from readdir, so no extra stat per entry
+    with os.scandir(path) as it:
+        entries = sorted(it, key=lambda entry: entry.name)  # Sort alphabetically
+
+    # If too many files, truncate the list
+    if len(entries) > max_files:
+        entries = entries[:max_files // 2] + [None] + entries[-max_files // 2:]
+    return entries
 
 def show_list(items, max_depth=2, max_head=5, max_tail=5):
     """Displays type, length, and content of nested list items in a structured format."""
     
+    out = []
+
     # Display overview of the list
-    items_type = type(items).__name__
     try:
         items_len = len(items)
     except TypeError:
         items_len = None  # Length is undefined for non-sequence types
     
-    print("List Overview:")
+    out.append("List Overview:")
     if items_len is not None:
-        print(f"Total items: {items_len}")
-
-    # Display list items with head and tail view
-    for index, item in enumerate(items):
-        # Skip middle items, showing head and tail only
-        if index >= max_head and index < items_len - max_tail:
-            if index == max_head:
-                print("...")
+        out.append(f"Total items: {items_len}")
+
+    # Display list items with head and tail view; the middle is never iterated
+    for entry in _head_tail(items, items_len, max_head, max_tail):
+        if entry is None:
+            out.append("...")
             continue
 
+        index, item = entry
         item_type = type(item).__name__
-        try:
-            item_len = len(item)
-        except TypeError:
-            item_len = None
+        item_len = _len_or_none(item)
 
         # Print item details
-        print(f"\n{index + 1}. list[{index}]")
-        print(f"   - Type: {item_type}")
+        out.append(f"\n{index + 1}. list[{index}]")
+        out.append(f"   - Type: {item_type}")
         if item_len is not None:
-            print(f"   - Length: {item_len}")
-        print(f"   - Value: {item}")
+            out.append(f"   - Length: {item_len}")
+        out.append(f"   - Value: {item}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 def show_dict(dct):
     """Displays type, length, and content of dictionary items in a structured format."""
     
-    print("Dictionary Overview:")
-    print(f"Total keys: {len(dct.keys())}")
-    print(f"Keys: {list(dct.keys())}\n")
+    out = []
+    out.append("Dictionary Overview:")
+    out.append(f"Total keys: {len(dct)}")
+    out.append(f"Keys: {_keys_preview(dct)}\n")
     
     for i, (key, value) in enumerate(dct.items()):
-        print(f"{i + 1}. dict['{key}']")
-        print(f"   - Type: {type(value).__name__}")
+        out.append(f"{i + 1}. dict['{key}']")
+        out.append(f"   - Type: {type(value).__name__}")
 
         # Display length if possible
-        if hasattr(value, "__len__"):
-            print(f"   - Length: {len(value)}")
+        value_len = _len_or_none(value)
+        if value_len is not None:
+            out.append(f"   - Length: {value_len}")
+
+        # Display value, bounding containers so they are not formatted in full
+        if type(value) in _CONTAINERS:
+            value = _short_repr.repr(value)
+        out.append(f"   - Value: {value}")
 
-        # Display value
-        print(f"   - Value: {value}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 def tree(start_path='.', max_files=100, max_depth=5, prefix='', current_depth=0):
     """
@@ -68,38 +143,50 @@ def tree(start_path='.', max_files=100, max_depth=5, prefix='', current_depth=0)
     - start_path: The directory path to start exploring (default: current directory '.').
     - max_files: The maximum number of files to display per directory. Exceeding this limit will result in truncation.
     - max_depth: The maximum depth to explore. Directories deeper than this will be truncated.
-    - prefix: A string used for indentation to represent the tree structure (used internally).
-    - current_depth: The current depth of the directory being explored (used internally).
+    - prefix: A string prepended to every line to indent the tree structure (default: '').
+    - current_depth: The depth assigned to start_path (default: 0).
     """
-    if current_depth > max_depth:
-        print(prefix + "└── ...")
-        return
+    # Walk the tree with an explicit stack of directory iterators instead of recursion
+    stack = []
 
-    try:
-        files = os.listdir(start_path)
-        files.sort()  # Sort alphabetically
-    except PermissionError:
-        print(prefix + "└── [Permission Denied]")
-        return
+    def descend(path, prefix, depth):
+        if depth > max_depth:
+            print(prefix + "└── ...")
+            return
 
-    # If too many files, truncate the list
-    if len(files) > max_files:
-        display_files = files[:max_files // 2] + ["..."] + files[-max_files // 2:]
-    else:
-        display_files = files
+        try:
+            entries = _scan_dir(path, max_files)
+        except PermissionError:
+            print(prefix + "└── [Permission Denied]")
+            return
+        stack.append((iter(enumerate(entries)), len(entries), prefix, depth))
+
+    descend(start_path, prefix, current_depth)
+
+    while stack:
+        entries, n_entries, prefix, depth = stack[-1]
+        next_entry = next(entries, None)
+        if next_entry is None:  # Directory exhausted
+            stack.pop()
+            continue
 
-    for i, name in enumerate(display_files):
-        path = os.path.join(start_path, name)
-        if name == "...":
-            print(prefix + "└── " + name)
+        i, entry = next_entry
+        if entry is None:
+            print(prefix + "└── ...")
             continue
 
-        connector = '└── ' if i == len(display_files) - 1 else '├── '
-        print(prefix + connector + name)
+        is_last = i == n_entries - 1
+        connector = '└── ' if is_last else '├── '
+        print(prefix + connector + entry.name)
 
-        if os.path.isdir(path):  # If the path is a directory
-            new_prefix = '    ' if i == len(display_files) - 1 else '│   '
-            tree(path, max_files, max_depth, prefix + new_prefix, current_depth + 1)
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False  # Unreadable symlink target; os.path.isdir() treated this as not a directory
+
+        if is_dir:  # If the path is a directory
+            new_prefix = '    ' if is_last else '│   '
+            descend(entry.path, prefix + new_prefix, depth + 1)
 
 def signature(func):
     """
@@ -132,7 +219,7 @@ def signature(func):
         print("The provided object does not have a valid signature.")
 
 
-def tab(module, include_private=False):
+def tab(module, include_private=False, style=True):
     """
     This function inspects the contents of a given module and returns details 
     about its components, including the name, type, and a brief description if possible.
@@ -141,51 +228,60 @@ def tab(module, include_private=False):
     Parameters:
     - module: The module to inspect.
     - include_private (bool): If True, includes private members (those starting with '_').
+    - style (bool): If True, returns a Styler for notebook display; if False, returns the plain DataFrame.
     """
-    # List to hold information about module contents, grouped by type
-    module_info = []
+    # Column lists to hold information about module contents
+    item_types, item_names, descriptions = [], [], []
+
+    # Read a plain module's namespace directly; modules with a custom __dir__ and
+    # non-module objects (whose attributes may be inherited) still go through dir()
+    # The namespace is copied up front, since getdoc() may run arbitrary code on each member
+    if isinstance(module, types.ModuleType) and '__dir__' not in vars(module):
+        namespace = dict(vars(module))
+        member_names = list(namespace)
+    else:
+        namespace = None
+        member_names = dir(module)
 
-    for item_name in dir(module):
+    for item_name in member_names:
         # Optionally skip private and special methods/attzributes
         if not include_private and item_name.startswith('_'):
             continue
 
         # Get the item from the module
-        item = getattr(module, item_name)
+        item = namespace[item_name] if namespace is not None else getattr(module, item_name)
 
         # Determine type of the item
         item_type = type(item).__name__
 
-        # Generate a full description using inspect.getdoc() without special characters
-        description = inspect.getdoc(item)
-        if description:
-            # Remove leading/trailing whitespace and replace internal newlines
-            description = description.strip()
-        else:
-            description = None  # Set to None if no description available
-
-        # Append item information to list
-        module_info.append({
-            'Type': item_type,
-            'Name': item_name,
-            'Description': description
-        })
+        # Append item information to the column lists; an empty docstring counts as no description
+        item_types.append(item_type)
+        item_names.append(item_name)
+        descriptions.append(inspect.getdoc(item) or None)
 
-    # Convert to DataFrame
-    df = pd.DataFrame(module_info)
+    # Convert to DataFrame column-wise
+    df = pd.DataFrame({
+        'Type': item_types,
+        'Name': item_names,
+        'Description': pd.Series(descriptions, dtype=object)  # Keeps .str usable when every entry is missing
+    })
 
-    # Add 'Description_present' column for sorting (True if Description exists, False otherwise)
-    df['Description_present'] = df['Description'].notna()
+    # Remove leading/trailing whitespace from all descriptions at once (missing ones stay missing)
+    df['Description'] = df['Description'].str.strip()
 
-    # Sort by 'Type', 'Description_present' (True first), then by 'Name'
+    # Sort by 'Type', whether 'Description' exists (present first), then by 'Name'
     df = df.sort_values(
-        by=['Type', 'Description_present', 'Name'],
-        ascending=[True, False, True]
-    ).drop(columns='Description_present')  # Drop temporary column after sorting
+        by=['Type', 'Description', 'Name'],
+        key=lambda col: col.isna() if col.name == 'Description' else col
+    )
 
     # Set index for a nested view
     nested_df = df.set_index(['Type', 'Name'])
 
+    # Skip building a Styler when the caller only needs the data
+    if not style:
+        return nested_df
+
     # Apply styling to make 'Description' column left-aligned
     styled_df = nested_df.style.set_properties(subset=['Description'], **{'text-align': 'left'})
     return styled_df
@@ -193,57 +289,63 @@ def tab(module, include_private=False):
 def show(item, max_depth=2, max_head_items=5, max_tail_items=5, max_value_length=100000):
     """Displays type, length, and content of list or dictionary in a structured format, truncating long values."""
     def truncate_value(value):
-        """Truncates the value to show only the first 100 and last 100 words if it is too long."""
+        """Truncates the value to show only the first 100 and last 100 words if it is too long; containers show their first items."""
+        if type(value) in _CONTAINERS:
+            return _short_repr.repr(value)
         value_str = str(value)
         words = value_str.split()
         if len(words) > 200:
             return " ".join(words[:100]) + " ... " + " ".join(words[-100:])
         return value_str
 
-    item_type = type(item).__name__
-    
-    try: 
-        item.keys()
-        print("Dictionary Overview:")
-        print(f"Total keys: {len(item.keys())}")
-        print(f"Keys: {list(item.keys())}\n")
+    out = []
+
+    # Dictionaries and anything else with keys() and items() (other mappings, pandas objects) get the
+    # dictionary view; classes are excluded since their keys/__iter__ attributes are unbound methods
+    is_class = isinstance(item, type)
+    if isinstance(item, dict) or (
+        not is_class and callable(getattr(item, "keys", None)) and callable(getattr(item, "items", None))
+    ):
+        keys = item.keys()  # Not len(item): for a DataFrame that counts rows, not columns
+        out.append("Dictionary Overview:")
+        out.append(f"Total keys: {len(keys)}")
+        out.append(f"Keys: {_keys_preview(keys)}\n")
         
         for i, (k, v) in enumerate(item.items()):
-            print(f"{i+1}. dict['{k}']")
-            print(f"   - Type: {type(v).__name__}")
+            out.append(f"{i+1}. dict['{k}']")
+            out.append(f"   - Type: {type(v).__name__}")
 
-            if hasattr(v, "__len__"):
-                print(f"   - Length: {len(v)}")
+            v_len = _len_or_none(v)
+            if v_len is not None:
+                out.append(f"   - Length: {v_len}")
             
-            print(f"   - Values: {truncate_value(v)}")
-    except:
-        if isinstance(item, Iterable):
-            try:
-                item_len = len(item)
-            except TypeError:
-                item_len = None
+            out.append(f"   - Values: {truncate_value(v)}")
+    elif isinstance(item, _CONTAINERS) or (not is_class and hasattr(item, "__iter__") and not isinstance(item, (str, bytes))):
+        try:
+            item_len = len(item)
+        except TypeError:
+            item_len = None
             
-            print("List Overview:")
-            if item_len is not None:
-                print(f"Total items: {item_len}")
+        out.append("List Overview:")
+        if item_len is not None:
+            out.append(f"Total items: {item_len}")
             
-            # Display list items with head and tail view
-            for idx, subitem in enumerate(item):
-                if idx >= max_head_items and idx < item_len - max_tail_items:
-                    if idx == max_head_items:
-                        print("...")
-                    continue
-
-                subitem_type = type(subitem).__name__
-                try:
-                    subitem_len = len(subitem)
-                except TypeError:
-                    subitem_len = None
-
-                print(f"\n{idx + 1}. list[{idx}]")
-                print(f"   - Type: {subitem_type}")
-                if subitem_len is not None:
-                    print(f"   - Length: {subitem_len}")
-                print(f"   - Values: {truncate_value(subitem)}")    
-        else:
-            print(f"Unsupported item type: {item_type}")
+        # Display list items with head and tail view
+        for entry in _head_tail(item, item_len, max_head_items, max_tail_items):
+            if entry is None:
+                out.append("...")
+                continue
+
+            idx, subitem = entry
+            subitem_type = type(subitem).__name__
+            subitem_len = _len_or_none(subitem)
+
+            out.append(f"\n{idx + 1}. list[{idx}]")
+            out.append(f"   - Type: {subitem_type}")
+            if subitem_len is not None:
+                out.append(f"   - Length: {subitem_len}")
+            out.append(f"   - Values: {truncate_value(subitem)}")
+    else:
+        out.append(f"Unsupported item type: {type(item).__name__}")
+
+    sys.stdout.write("\n".join(out) + "\n")